@@ -2,13 +2,16 @@
 # -*- coding: utf-8 -*
 
 import sys
+import time
 import subprocess
 import re
 from pathlib import Path
 
+START_TIME = time.perf_counter()
+
 from PyQt5 import QtWidgets
 from PyQt5.QtGui import QIcon
-from PyQt5.QtCore import QSize, Qt
+from PyQt5.QtCore import QSize, Qt, QTimer
 
 
 class PdfTool(QtWidgets.QDialog):
@@ -19,12 +22,19 @@ class PdfTool(QtWidgets.QDialog):
         self.setWindowTitle('Pdf Tool')
         self.vertical_layout = QtWidgets.QVBoxLayout()
         self.tab_widget = QtWidgets.QTabWidget()
-        self.tab_widget.addTab(TabCompress(), 'Compress')
-        self.tab_widget.addTab(TabSplit(), 'Split')
-        self.tab_widget.addTab(TabMerge(), 'Merge')
+        self.tab_widget.addTab(LazyTab(TabCompress), 'Compress')
+        self.tab_widget.addTab(LazyTab(TabSplit), 'Split')
+        self.tab_widget.addTab(LazyTab(TabMerge), 'Merge')
+        self.tab_widget.currentChanged.connect(self.build_tab)
+        self.build_tab(self.tab_widget.currentIndex())
         self.vertical_layout.addWidget(self.tab_widget)
         self.setLayout(self.vertical_layout)
 
+    def build_tab(self, index):
+        """Build the contents of the tab with the given index if they don't exist yet.
+        """
+        self.tab_widget.widget(index).build()
+
     @staticmethod
     def get_all_files(folder):
         """Returns a list of all pdf files existing in the given folder.
@@ -64,6 +74,24 @@ class PdfTool(QtWidgets.QDialog):
         return page_count
 
 
+class LazyTab(QtWidgets.QWidget):
+    """Placeholder page of the tab widget. Creates an instance of the given tab class on the first call of build().
+    """
+    def __init__(self, tab_class):
+        super().__init__()
+        self.tab_class = tab_class
+        self.tab = None
+        self.vertical_layout = QtWidgets.QVBoxLayout(self)
+        self.vertical_layout.setContentsMargins(0, 0, 0, 0)
+
+    def build(self):
+        """Create the tab and add it to the layout if not done yet.
+        """
+        if self.tab is None:
+            self.tab = self.tab_class()
+            self.vertical_layout.addWidget(self.tab)
+
+
 class TabCompress(QtWidgets.QWidget):
     """Tab containing the elements for pdf compression.
     """
@@ -72,10 +100,6 @@ class TabCompress(QtWidgets.QWidget):
         self.horizontal_layout = QtWidgets.QHBoxLayout(self)
         self.horizontal_layout.setContentsMargins(10, 10, 10, 10)
         self.horizontal_layout.setSpacing(10)
-        self.file_dialog_input = QtWidgets.QFileDialog()
-        self.folder_dialog_output = QtWidgets.QFileDialog()
-
-        self.folder_dialog = QtWidgets.QFileDialog()
         self.file_list = []
         self.output_path = Path().home()
         self.file_list_widget = QtWidgets.QListWidget()
@@ -209,9 +233,7 @@ class TabCompress(QtWidgets.QWidget):
     def open_file_dialog_input(self):
         """Opens the file dialog to choose the input file(s). Writes its value(s) to self.file_list.
         """
-        self.file_dialog_input.setFileMode(QtWidgets.QFileDialog.ExistingFiles)
-        self.file_dialog_input.setAcceptMode(QtWidgets.QFileDialog.AcceptSave)
-        file_list_temp = self.file_dialog_input.getOpenFileNames(
+        file_list_temp = QtWidgets.QFileDialog.getOpenFileNames(
             self, 'Select pdf files to compress!', '', 'Pdf files (*.pdf)'
                                                                  )[0]
         if file_list_temp:
@@ -224,8 +246,7 @@ class TabCompress(QtWidgets.QWidget):
         """Opens the folder dialog to choose the folder containing the input files.
         Writes its value to self.file_list via the method PdfTool.get_all_files.
         """
-        self.folder_dialog.setAcceptMode(QtWidgets.QFileDialog.AcceptSave)
-        folder = Path(self.folder_dialog.getExistingDirectory(self, 'Select folder!'))
+        folder = Path(QtWidgets.QFileDialog.getExistingDirectory(self, 'Select folder!'))
         if folder.root:
             self.file_list += PdfTool.get_all_files(folder)
             PdfTool.refresh_list_widget(self.file_list, self.file_list_widget)
@@ -234,7 +255,7 @@ class TabCompress(QtWidgets.QWidget):
     def open_folder_dialog_output(self):
         """Opens the folder dialog to choose the destination of the output files. Writes its value to self.output_path.
         """
-        path = self.folder_dialog_output.getExistingDirectory(self, 'Change output folder!')
+        path = QtWidgets.QFileDialog.getExistingDirectory(self, 'Change output folder!')
         if path:
             self.output_path = Path(path)
             self.refresh_output_label()
@@ -272,8 +293,6 @@ class TabSplit(QtWidgets.QWidget):
         self.horizontal_layout = QtWidgets.QHBoxLayout(self)
         self.horizontal_layout.setContentsMargins(10, 10, 10, 10)
         self.horizontal_layout.setSpacing(20)
-        self.file_dialog_input = QtWidgets.QFileDialog()
-        self.folder_dialog_output = QtWidgets.QFileDialog()
         self.file = ""
         self.label_split_pattern = QtWidgets.QLabel('Pages to extract:')
         self.label_file = QtWidgets.QLabel()
@@ -342,9 +361,7 @@ class TabSplit(QtWidgets.QWidget):
     def open_file_dialog_input(self):
         """Opens the file dialog to choose the input file. Writes its value to self.file.
         """
-        self.file_dialog_input.setFileMode(QtWidgets.QFileDialog.ExistingFile)
-        self.file_dialog_input.setAcceptMode(QtWidgets.QFileDialog.AcceptSave)
-        self.file = self.file_dialog_input.getOpenFileName(
+        self.file = QtWidgets.QFileDialog.getOpenFileName(
             self, 'Select pdf file to split!', '', 'Pdf files (*.pdf)'
                                                            )[0]
         if self.file:
@@ -356,7 +373,7 @@ class TabSplit(QtWidgets.QWidget):
     def open_folder_dialog_output(self):
         """Opens the folder dialog to choose the destination of the output files. Writes its value to self.output_path.
         """
-        path = self.folder_dialog_output.getExistingDirectory(self, 'Select output folder!')
+        path = QtWidgets.QFileDialog.getExistingDirectory(self, 'Select output folder!')
         if path:
             self.label_output_path.setText(f'Output File:    {path}/{self.output_filename_line_edit.text()}.pdf')
             self.output_path = Path(path)
@@ -456,10 +473,6 @@ class TabMerge(QtWidgets.QWidget):
         self.horizontal_layout = QtWidgets.QHBoxLayout(self)
         self.horizontal_layout.setContentsMargins(10, 10, 10, 10)
         self.horizontal_layout.setSpacing(10)
-        self.file_dialog_input = QtWidgets.QFileDialog()
-        self.folder_dialog_output = QtWidgets.QFileDialog()
-
-        self.folder_dialog = QtWidgets.QFileDialog()
         self.file_list = []
         self.output_filename_line_edit = QtWidgets.QLineEdit()
         self.output_filename_line_edit.textChanged.connect(self.refresh_output_label)
@@ -575,9 +588,7 @@ class TabMerge(QtWidgets.QWidget):
     def open_file_dialog_input(self):
         """Opens the file dialog to choose the input file(s). Writes its value(s) to self.file_list.
         """
-        self.file_dialog_input.setFileMode(QtWidgets.QFileDialog.ExistingFiles)
-        self.file_dialog_input.setAcceptMode(QtWidgets.QFileDialog.AcceptSave)
-        file_list_temp = self.file_dialog_input.getOpenFileNames(
+        file_list_temp = QtWidgets.QFileDialog.getOpenFileNames(
             self, 'Select pdf files to compress!', '', 'Pdf files (*.pdf)'
                                                                  )[0]
         if file_list_temp:
@@ -588,7 +599,7 @@ class TabMerge(QtWidgets.QWidget):
     def open_folder_dialog_output(self):
         """Opens the folder dialog to choose the destination of the output file. Writes its value to self.output_path.
         """
-        path = self.folder_dialog_output.getExistingDirectory(self, 'Select output folder!')
+        path = QtWidgets.QFileDialog.getExistingDirectory(self, 'Select output folder!')
         if path:
             self.label_output_path.setText(f'Output File:     {path}/{self.output_filename_line_edit.text()}.pdf')
             self.output_path = Path(path)
@@ -597,8 +608,7 @@ class TabMerge(QtWidgets.QWidget):
         """Opens the folder dialog to choose the folder containing the input files.
         Writes its value to self.file_list via the method PdfTool.get_all_files.
         """
-        self.folder_dialog.setAcceptMode(QtWidgets.QFileDialog.AcceptSave)
-        folder = Path(self.folder_dialog.getExistingDirectory(self, 'Select folder!'))
+        folder = Path(QtWidgets.QFileDialog.getExistingDirectory(self, 'Select folder!'))
         if folder.root:
             self.file_list += PdfTool.get_all_files(folder)
             PdfTool.refresh_list_widget(self.file_list, self.file_list_widget)
@@ -639,10 +649,20 @@ class TabMerge(QtWidgets.QWidget):
             message_box.show()
 
 
+def print_startup_time():
+    """Prints the time elapsed since the start of the script and quits the application.
+    Called from the event loop once the main window is shown.
+    """
+    print(f'Startup time: {time.perf_counter() - START_TIME:.3f} s')
+    QtWidgets.QApplication.quit()
+
+
 def main():
     app = QtWidgets.QApplication(sys.argv)
     main.pdf_tool = PdfTool()
     main.pdf_tool.show()
+    if '--startup-time' in app.arguments():
+        QTimer.singleShot(0, print_startup_time)
     sys.exit(app.exec_())
 
 